@@ -2284,7 +2284,7 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         """
         # The location parameter is a convenience functionality added by us, so enforcing the
         # mutual exclusivity here is nothing that Telegram would handle anyway
-        if not (all([latitude, longitude]) or location):
+        if not ((latitude and longitude) or location):
             raise ValueError(
                 "Either location or latitude and longitude must be passed as argument."
             )
@@ -2444,12 +2444,12 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         """
         # The venue parameter is a convenience functionality added by us, so enforcing the
         # mutual exclusivity here is nothing that Telegram would handle anyway
-        if not (venue or all([latitude, longitude, address, title])):
+        if not (venue or (latitude and longitude and address and title)):
             raise ValueError(
                 "Either venue or latitude, longitude, address and title must be "
                 "passed as arguments."
             )
-        if not bool(venue) ^ any([latitude, longitude, address, title]):
+        if not bool(venue) ^ bool(latitude or longitude or address or title):
             raise ValueError(
                 "Either venue or latitude, longitude, address and title must be "
                 "passed as arguments. Not both."
@@ -2556,11 +2556,11 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         """
         # The contact parameter is a convenience functionality added by us, so enforcing the
         # mutual exclusivity here is nothing that Telegram would handle anyway
-        if (not contact) and (not all([phone_number, first_name])):
+        if (not contact) and (not (phone_number and first_name)):
             raise ValueError(
                 "Either contact or phone_number and first_name must be passed as arguments."
             )
-        if not bool(contact) ^ any([phone_number, first_name]):
+        if not bool(contact) ^ bool(phone_number or first_name):
             raise ValueError(
                 "Either contact or phone_number and first_name must be passed as arguments. "
                 "Not both."
@@ -169,19 +169,24 @@ class AIORateLimiter(BaseRateLimiter[int]):
         # This is a minimal effort approach - a full-fledged cache could use a TTL approach
         # or at least adapt the threshold dynamically depending on the number of active limiters
         if len(self._group_limiters) > 512:
-            # We copy to avoid modifying the dict while we iterate over it
-            for key, limiter in self._group_limiters.copy().items():
-                if key == group_id:
-                    continue
-                if limiter.has_capacity(limiter.max_rate):
-                    del self._group_limiters[key]
-
-        if group_id not in self._group_limiters:
-            self._group_limiters[group_id] = AsyncLimiter(
+            # We first collect the keys to remove instead of copying the whole dict just to
+            # avoid modifying it while we iterate over it
+            stale_keys = [
+                key
+                for key, limiter in self._group_limiters.items()
+                if key != group_id and limiter.has_capacity(limiter.max_rate)
+            ]
+            for key in stale_keys:
+                del self._group_limiters[key]
+
+        # A single lookup suffices for the common case of an already known group
+        limiter = self._group_limiters.get(group_id)
+        if limiter is None:
+            limiter = self._group_limiters[group_id] = AsyncLimiter(
                 max_rate=self._group_max_rate,
                 time_period=self._group_time_period,
             )
-        return self._group_limiters[group_id]
+        return limiter
 
     async def _run_request(
         self,
@@ -315,13 +315,15 @@ class ExtBot(Bot, Generic[RLARGS]):
         So we can override Bot._do_post to add rate limiting.
         """
         rate_limit_args = self._extract_rl_kwargs(data)
-        if not self.rate_limiter and rate_limit_args is not None:
+        # The rate limiter is fixed for the lifetime of the bot, so we look it up only once
+        rate_limiter = self._rate_limiter
+        if not rate_limiter and rate_limit_args is not None:
             raise ValueError(
                 "`rate_limit_args` can only be used if a `ExtBot.rate_limiter` is set."
             )
 
         # getting updates should not be rate limited!
-        if endpoint == "getUpdates" or not self.rate_limiter:
+        if endpoint == "getUpdates" or not rate_limiter:
             return await super()._do_post(
                 endpoint=endpoint,
                 data=data,
@@ -339,10 +341,10 @@ class ExtBot(Bot, Generic[RLARGS]):
         }
         self._LOGGER.debug(
             "Passing request through rate limiter of type %s with rate_limit_args %s",
-            type(self.rate_limiter),
+            type(rate_limiter),
             rate_limit_args,
         )
-        return await self.rate_limiter.process_request(
+        return await rate_limiter.process_request(
             callback=super()._do_post,
             args=(endpoint, data),
             kwargs=kwargs,